@@ -3,21 +3,25 @@
 Example usage of the WordPress client with the dockerized WordPress instance.
 """
 import os
+import signal
 import sys
-import time
+import threading
 from pathlib import Path
 
-try:
-    from dotenv import load_dotenv
-    # Load .env file if it exists
-    env_file = Path(__file__).parent / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
-        print(f"📁 Loaded environment from: {env_file}")
-    else:
-        print("ℹ️  No .env file found, using system environment variables")
-except ImportError:
-    print("ℹ️  python-dotenv not available, using system environment variables only")
+# Only load .env when credentials aren't already in the environment,
+# so the dotenv import and file parse are skipped when unnecessary.
+if not os.environ.get('WORDPRESS_URL'):
+    try:
+        from dotenv import load_dotenv
+        # Load .env file if it exists
+        env_file = Path(__file__).parent / '.env'
+        if env_file.exists():
+            load_dotenv(env_file)
+            print(f"📁 Loaded environment from: {env_file}")
+        else:
+            print("ℹ️  No .env file found, using system environment variables")
+    except ImportError:
+        print("ℹ️  python-dotenv not available, using system environment variables only")
 
 from wordpress_client import WordPressClient
 
@@ -43,19 +47,21 @@ def test_connection(client):
 def main():
     """Main example function."""
     # Get WordPress connection details from environment variables
-    wordpress_url = os.getenv('WORDPRESS_URL')
-    username = os.getenv('WORDPRESS_USERNAME')
-    password = os.getenv('WORDPRESS_PASSWORD')
-    
-    if not all([wordpress_url, username, password]):
+    wordpress_url = os.environ.get('WORDPRESS_URL')
+    username = os.environ.get('WORDPRESS_USERNAME')
+    password = os.environ.get('WORDPRESS_PASSWORD')
+
+    hints = {
+        'WORDPRESS_URL (e.g., https://your-site.com)': wordpress_url,
+        'WORDPRESS_USERNAME': username,
+        'WORDPRESS_PASSWORD (use Application Password from WordPress)': password,
+    }
+    missing = [hint for hint, value in hints.items() if not value]
+    if missing:
         print("❌ Error: Missing required environment variables!")
         print("💡 Please set the following in your .env file:")
-        if not wordpress_url:
-            print("   - WORDPRESS_URL (e.g., https://your-site.com)")
-        if not username:
-            print("   - WORDPRESS_USERNAME")
-        if not password:
-            print("   - WORDPRESS_PASSWORD (use Application Password from WordPress)")
+        for hint in missing:
+            print(f"   - {hint}")
         print("\n🔑 Create Application Passwords at: WordPress Admin → Users → Profile → Application Passwords")
         sys.exit(1)
     
@@ -83,13 +89,26 @@ def main():
         print("- Create post: client.create_post({'title': 'My Post', 'content': 'Hello World!'})")
         print("- Get users: client.get_users()")
         
-        # Keep the container running
+        # Keep the container running with a blocking wait instead of a
+        # once-per-second polling loop (no idle CPU wakeups).
         print("\n🔄 Container is running. Press Ctrl+C to exit.")
         try:
-            while True:
-                time.sleep(1)
+            if hasattr(signal, 'sigwait'):
+                # Block in the kernel until SIGINT/SIGTERM arrives, so
+                # docker stop terminates immediately instead of waiting
+                # out a sleep tick.
+                signal.pthread_sigmask(
+                    signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM}
+                )
+                signal.sigwait({signal.SIGINT, signal.SIGTERM})
+            else:
+                # Windows has no sigwait; fall back to an Event wait.
+                stop = threading.Event()
+                signal.signal(signal.SIGTERM, lambda *_: stop.set())
+                stop.wait()
         except KeyboardInterrupt:
-            print("\n👋 Goodbye!")
+            pass
+        print("\n👋 Goodbye!")
             
     except Exception as e:
         print(f"❌ Error: {e}")
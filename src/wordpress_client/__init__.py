@@ -0,0 +1,59 @@
+"""
+WordPress Client - A Python library for the WordPress REST API.
+
+Provides a client for managing posts, categories, and media on
+WordPress sites via Application Passwords or JWT authentication.
+"""
+
+from .client import WordPressClient, WPClient
+from .auth import AuthBase, ApplicationPasswordAuth, JWTAuth
+from .exceptions import (
+    WordPressAPIError,
+    AuthenticationError,
+    NotFoundError,
+    ValidationError,
+    PermissionError,
+)
+
+__version__ = "0.1.0"
+
+# Model classes are resolved lazily (PEP 562) so importing the package
+# doesn't pay the models' import cost unless they are actually used.
+_LAZY_MODEL_EXPORTS = {
+    "Post": ".models.post",
+    "PostCreate": ".models.post",
+    "PostUpdate": ".models.post",
+    "Media": ".models.media",
+    "MediaUpload": ".models.media",
+    "MediaUpdate": ".models.media",
+    "Category": ".models.category",
+    "CategoryCreate": ".models.category",
+    "CategoryUpdate": ".models.category",
+}
+
+__all__ = [
+    "WordPressClient",
+    "WPClient",
+    "AuthBase",
+    "ApplicationPasswordAuth",
+    "JWTAuth",
+    "WordPressAPIError",
+    "AuthenticationError",
+    "NotFoundError",
+    "ValidationError",
+    "PermissionError",
+    *_LAZY_MODEL_EXPORTS,
+]
+
+
+def __getattr__(name: str):
+    """Resolve model exports on first access (PEP 562)."""
+    module_name = _LAZY_MODEL_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
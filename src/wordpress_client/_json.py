@@ -0,0 +1,30 @@
+"""
+JSON helpers with an optional orjson fast path.
+
+orjson encodes/decodes several times faster than the stdlib json
+module; fall back to stdlib when it isn't installed.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return orjson.dumps(obj)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - optional dependency
+    import json as _stdlib_json
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return _stdlib_json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return _stdlib_json.loads(data)
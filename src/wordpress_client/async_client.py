@@ -0,0 +1,480 @@
+"""
+Asynchronous WordPress REST API Client.
+
+aiohttp-based sibling of WordPressClient for issuing many REST calls
+concurrently when the batch endpoint is unavailable.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from ._json import dumps, loads
+from .auth import AuthBase, ApplicationPasswordAuth
+from .exceptions import (
+    EXCEPTION_BY_STATUS,
+    WordPressAPIError,
+    ValidationError,
+)
+from .utils import ACCEPT_ENCODING, build_api_url, guess_mime_type, parse_wp_error
+from .models import (
+    POST_LIST_ADAPTER,
+    CATEGORY_LIST_ADAPTER,
+    MEDIA_LIST_ADAPTER,
+)
+from .models.post import Post
+from .models.media import Media
+from .models.category import Category
+
+
+class AsyncWordPressClient:
+    """
+    Asynchronous WordPress REST API Client.
+
+    Mirrors the read operations of WordPressClient on top of aiohttp so
+    independent requests (e.g. all pages of a listing) can run in
+    parallel over a pooled connector.
+
+    Requires the optional aiohttp dependency.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth: Optional[AuthBase] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: int = 30,
+    ):
+        """
+        Initialize async WordPress client.
+
+        Args:
+            base_url: WordPress site base URL
+            auth: Authentication object (ApplicationPasswordAuth or JWTAuth)
+            username: Username (if auth not provided)
+            password: Password/Application Password (if auth not provided)
+            timeout: Request timeout in seconds
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncWordPressClient "
+                "(pip install wordpress-client[async])"
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+        if auth:
+            self.auth = auth
+        elif username and password:
+            self.auth = ApplicationPasswordAuth(username, password)
+        else:
+            self.auth = None
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the aiohttp session, creating it lazily on first use."""
+        if self._session is None or self._session.closed:
+            headers = {
+                "User-Agent": "wordpress-client/0.1.0",
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Accept": "application/json",
+            }
+            if self.auth:
+                headers.update(self.auth.get_auth_headers())
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=256, limit_per_host=64, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=headers,
+                json_serialize=lambda obj: dumps(obj).decode("utf-8"),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncWordPressClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _request_with_headers(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Union[Dict, List], Dict[str, str]]:
+        """
+        Make HTTP request and return (body, response headers).
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint
+            params: Query parameters
+            data: Request body data
+
+        Returns:
+            Tuple of (response data, response headers)
+
+        Raises:
+            WordPressAPIError: On API errors
+        """
+        url = build_api_url(self.base_url, endpoint, params)
+        session = self._get_session()
+
+        try:
+            async with session.request(method, url, json=data) as response:
+                raw = await response.read()
+                # Decode failures (e.g. an HTML error page) surface as
+                # WordPressAPIError like any other bad response.
+                try:
+                    body = loads(raw) if raw else {}
+                except ValueError as e:
+                    raise WordPressAPIError(f"Invalid JSON response: {str(e)}")
+
+                if response.status >= 400:
+                    exc = EXCEPTION_BY_STATUS.get(
+                        response.status, WordPressAPIError
+                    )
+                    raise exc(parse_wp_error(body), response.status, body)
+
+                return body, dict(response.headers)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Total-timeout expiry raises asyncio.TimeoutError, not a
+            # ClientError; wrap both so callers only see WordPressAPIError.
+            raise WordPressAPIError(f"Request failed: {str(e)}")
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Union[Dict, List]:
+        """
+        Make HTTP request to WordPress API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint
+            params: Query parameters
+            data: Request body data
+
+        Returns:
+            Response data
+
+        Raises:
+            WordPressAPIError: On API errors
+        """
+        body, _ = await self._request_with_headers(method, endpoint, params, data)
+        return body
+
+    async def _request_list(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> List:
+        """
+        Make a request whose response must be a JSON array.
+
+        Raises:
+            WordPressAPIError: On API errors or a non-array response
+        """
+        response = await self._request(method, endpoint, params, data)
+        if not isinstance(response, list):
+            raise WordPressAPIError("Invalid response format")
+        return response
+
+    # ==================== POST OPERATIONS ====================
+
+    async def get_posts(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        categories: Optional[List[int]] = None,
+        tags: Optional[List[int]] = None,
+    ) -> List[Post]:
+        """
+        Get list of posts.
+
+        Args:
+            page: Page number
+            per_page: Posts per page (max 100)
+            search: Search term
+            status: Post status filter
+            categories: Filter by category IDs
+            tags: Filter by tag IDs
+
+        Returns:
+            List of Post objects
+        """
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": min(per_page, 100),
+        }
+
+        if search:
+            params["search"] = search
+        if status:
+            params["status"] = status
+        if categories:
+            params["categories"] = categories
+        if tags:
+            params["tags"] = tags
+
+        data = await self._request_list("GET", "wp/v2/posts", params=params)
+        return POST_LIST_ADAPTER.validate_python(data)
+
+    async def get_all_posts(
+        self,
+        per_page: int = 100,
+        concurrency: int = 10,
+        **filters: Any,
+    ) -> List[Post]:
+        """
+        Get all posts across every page.
+
+        Fetches page 1 to learn the total page count from the
+        X-WP-TotalPages header, then requests the remaining pages
+        concurrently, bounded by a semaphore.
+
+        Args:
+            per_page: Posts per page request (max 100)
+            concurrency: Maximum concurrent page requests
+            **filters: Extra filters passed to get_posts
+                (search, status, categories, tags)
+
+        Returns:
+            List of Post objects from all pages
+        """
+        params: Dict[str, Any] = {"page": 1, "per_page": min(per_page, 100)}
+        for key, value in filters.items():
+            if value is None:
+                continue
+            params[key] = value
+
+        data, headers = await self._request_with_headers(
+            "GET", "wp/v2/posts", params=params
+        )
+        if not isinstance(data, list):
+            raise WordPressAPIError("Invalid response format")
+        posts = POST_LIST_ADAPTER.validate_python(data)
+        total_pages = int(headers.get("X-WP-TotalPages", 1))
+
+        if total_pages > 1:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch_page(page: int) -> List[Post]:
+                async with semaphore:
+                    return await self.get_posts(
+                        page=page, per_page=per_page, **filters
+                    )
+
+            pages = await asyncio.gather(
+                *[fetch_page(p) for p in range(2, total_pages + 1)]
+            )
+            for page_posts in pages:
+                posts.extend(page_posts)
+
+        return posts
+
+    async def get_post(self, post_id: int) -> Post:
+        """
+        Get a single post by ID.
+
+        Args:
+            post_id: Post ID
+
+        Returns:
+            Post object
+        """
+        data = await self._request("GET", f"wp/v2/posts/{post_id}")
+        if not isinstance(data, dict):
+            raise WordPressAPIError("Invalid response format")
+        return Post(**data)
+
+    # ==================== CATEGORY OPERATIONS ====================
+
+    async def get_categories(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        parent: Optional[int] = None,
+    ) -> List[Category]:
+        """
+        Get list of categories.
+
+        Args:
+            page: Page number
+            per_page: Categories per page (max 100)
+            search: Search term
+            parent: Filter by parent category ID
+
+        Returns:
+            List of Category objects
+        """
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": min(per_page, 100),
+        }
+
+        if search:
+            params["search"] = search
+        if parent is not None:
+            params["parent"] = parent
+
+        data = await self._request_list("GET", "wp/v2/categories", params=params)
+        return CATEGORY_LIST_ADAPTER.validate_python(data)
+
+    # ==================== MEDIA OPERATIONS ====================
+
+    async def get_media(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        search: Optional[str] = None,
+        media_type: Optional[str] = None,
+    ) -> List[Media]:
+        """
+        Get list of media items.
+
+        Args:
+            page: Page number
+            per_page: Items per page (max 100)
+            search: Search term
+            media_type: Filter by media type (image, video, audio)
+
+        Returns:
+            List of Media objects
+        """
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": min(per_page, 100),
+        }
+
+        if search:
+            params["search"] = search
+        if media_type:
+            params["media_type"] = media_type
+
+        data = await self._request_list("GET", "wp/v2/media", params=params)
+        return MEDIA_LIST_ADAPTER.validate_python(data)
+
+    async def upload_media(
+        self,
+        file_path: str,
+        title: Optional[str] = None,
+        alt_text: Optional[str] = None,
+        caption: Optional[str] = None,
+        post_id: Optional[int] = None,
+    ) -> Media:
+        """
+        Upload a media file.
+
+        The multipart body is streamed from disk in chunks by aiohttp,
+        so peak memory stays constant regardless of file size.
+
+        Args:
+            file_path: Local file path
+            title: Media title
+            alt_text: Alternative text
+            caption: Caption text
+            post_id: Associated post ID
+
+        Returns:
+            Created Media object
+        """
+        path = Path(file_path)
+        mime_type = guess_mime_type(path.name)
+
+        params = {}
+        if alt_text:
+            params["alt_text"] = alt_text
+        if caption:
+            params["caption"] = caption
+        if title:
+            params["title"] = title
+        if post_id:
+            params["post"] = post_id
+
+        url = build_api_url(self.base_url, "wp/v2/media", params)
+        session = self._get_session()
+
+        headers = {}
+        if title:
+            headers["Content-Disposition"] = f'attachment; filename="{path.name}"'
+
+        # Open directly instead of exists() + open, avoiding a second
+        # stat call per upload.
+        try:
+            file_obj = path.open("rb")
+        except OSError:
+            raise ValidationError(f"File not found: {file_path}")
+
+        with file_obj as f:
+            form = aiohttp.FormData()
+            form.add_field("file", f, filename=path.name, content_type=mime_type)
+
+            try:
+                async with session.post(url, data=form, headers=headers) as response:
+                    raw = await response.read()
+                    try:
+                        body = loads(raw) if raw else {}
+                    except ValueError as e:
+                        raise WordPressAPIError(
+                            f"Invalid JSON response: {str(e)}"
+                        )
+                    if response.status >= 400:
+                        raise WordPressAPIError(
+                            parse_wp_error(body), response.status, body
+                        )
+                    return Media(**body)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise WordPressAPIError(f"Media upload failed: {str(e)}")
+
+    async def upload_media_bulk(
+        self,
+        file_paths: List[str],
+        concurrency: int = 4,
+        post_id: Optional[int] = None,
+    ) -> List[Media]:
+        """
+        Upload multiple media files concurrently.
+
+        Individual uploads overlap their disk reads, TLS handshakes,
+        and network round-trips, bounded by a semaphore.
+
+        Args:
+            file_paths: Local file paths to upload
+            concurrency: Maximum concurrent uploads
+            post_id: Associated post ID applied to every upload
+
+        Returns:
+            List of created Media objects, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload_one(path: str) -> Media:
+            async with semaphore:
+                return await self.upload_media(path, post_id=post_id)
+
+        return await asyncio.gather(*(upload_one(p) for p in file_paths))
@@ -6,9 +6,37 @@ Supports both Application Passwords and JWT token authentication.
 
 from typing import Optional
 import base64
+import json
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from ._json import loads
 from .exceptions import AuthenticationError
 
+# Shared fallback session so auth round-trips reuse pooled connections
+# even when the caller doesn't supply a session of its own.
+_default_session: Optional[requests.Session] = None
+
+
+def get_default_session() -> requests.Session:
+    """Return the module-level shared session, creating it on first use."""
+    global _default_session
+    if _default_session is None:
+        _default_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        _default_session.mount("https://", adapter)
+        _default_session.mount("http://", adapter)
+    return _default_session
+
 
 class AuthBase:
     """Base class for authentication methods."""
@@ -38,6 +66,12 @@ class ApplicationPasswordAuth(AuthBase):
         self.app_password = app_password
         self._validate_credentials()
 
+        # Credentials never change, so encode the header once up front
+        # instead of re-encoding on every request.
+        credentials = f"{self.username}:{self.app_password}"
+        encoded = base64.b64encode(credentials.encode()).decode()
+        self._headers = {"Authorization": f"Basic {encoded}"}
+
     def _validate_credentials(self) -> None:
         """Validate that credentials are provided."""
         if not self.username or not self.app_password:
@@ -50,9 +84,7 @@ class ApplicationPasswordAuth(AuthBase):
         Returns:
             Dictionary with Authorization header
         """
-        credentials = f"{self.username}:{self.app_password}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return {"Authorization": f"Basic {encoded}"}
+        return self._headers
 
 
 class JWTAuth(AuthBase):
@@ -64,7 +96,12 @@ class JWTAuth(AuthBase):
     """
 
     def __init__(
-        self, base_url: str, username: str, password: str, token: Optional[str] = None
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        token: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize JWT authentication.
@@ -74,30 +111,52 @@ class JWTAuth(AuthBase):
             username: WordPress username
             password: WordPress password
             token: Pre-existing JWT token (optional)
+            session: requests.Session to reuse for auth calls (optional)
         """
+        self.session = session or get_default_session()
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.token = token
+        self._headers = {"Authorization": f"Bearer {token}"} if token else None
+        self._exp = self._decode_exp(token) if token else None
 
         if not self.token:
             self._authenticate()
 
+    @staticmethod
+    def _decode_exp(token: str) -> Optional[float]:
+        """Extract the exp claim from a JWT without verifying the signature."""
+        try:
+            payload_b64 = token.split(".")[1]
+            padded = payload_b64 + "=" * (-len(payload_b64) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            return payload.get("exp")
+        except (IndexError, ValueError, TypeError):
+            return None
+
     def _authenticate(self) -> None:
         """Authenticate and get JWT token."""
         url = f"{self.base_url}/wp-json/jwt-auth/v1/token"
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 url, json={"username": self.username, "password": self.password}
             )
             response.raise_for_status()
-            data = response.json()
+            try:
+                data = loads(response.content)
+            except ValueError as e:
+                raise AuthenticationError(f"Invalid response from token endpoint: {str(e)}")
             self.token = data.get("token")
 
             if not self.token:
                 raise AuthenticationError("No token received from server")
 
+            # Refresh the cached header and expiry whenever the token changes.
+            self._headers = {"Authorization": f"Bearer {self.token}"}
+            self._exp = self._decode_exp(self.token)
+
         except requests.exceptions.RequestException as e:
             raise AuthenticationError(f"Failed to authenticate: {str(e)}")
 
@@ -110,24 +169,39 @@ class JWTAuth(AuthBase):
         """
         if not self.token:
             self._authenticate()
+        elif self._exp is not None and self._exp - time.time() < 60:
+            # Token is about to expire; refresh proactively so the
+            # caller's request doesn't fail with a 401.
+            self.refresh_token()
 
-        return {"Authorization": f"Bearer {self.token}"}
+        return self._headers
 
-    def validate_token(self) -> bool:
+    def validate_token(self, force: bool = False) -> bool:
         """
         Validate the current JWT token.
 
+        By default the expiry cached from the token's exp claim is
+        checked locally, avoiding a network round-trip. Pass force=True
+        to validate against the server instead.
+
+        Args:
+            force: Validate against the server even if the cached
+                expiry is still valid
+
         Returns:
             True if token is valid, False otherwise
         """
         if not self.token:
             return False
 
+        if not force:
+            return self._exp is not None and time.time() < self._exp - 30
+
         url = f"{self.base_url}/wp-json/jwt-auth/v1/token/validate"
         headers = self.get_auth_headers()
 
         try:
-            response = requests.post(url, headers=headers)
+            response = self.session.post(url, headers=headers)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
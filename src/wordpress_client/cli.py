@@ -6,42 +6,115 @@ Provides CLI commands for interacting with WordPress.
 
 import sys
 import os
-from typing import Optional
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 import click
-from dotenv import load_dotenv
 
-from .client import WordPressClient
-from .models.post import PostCreate, PostUpdate
-from .models.category import CategoryCreate
 from .exceptions import WordPressAPIError
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from .client import WordPressClient
 
 
-def get_client() -> WordPressClient:
+def get_credentials() -> tuple:
     """
-    Get WordPress client from environment variables.
+    Get WordPress credentials from environment variables.
 
     Required environment variables:
     - WP_URL: WordPress site URL
     - WP_USERNAME: WordPress username
     - WP_PASSWORD: WordPress password or application password
     """
-    url = os.getenv("WP_URL", "")
-    username = os.getenv("WP_USERNAME")
-    password = os.getenv("WP_PASSWORD")
-
-    if not all([url, username, password]):
+    # Load .env lazily so commands that never need credentials
+    # (--help, completion) skip the dotenv import and file parse.
+    if not os.environ.get("WP_URL"):
+        try:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+        except ImportError:
+            pass
+
+    required = {
+        "WP_URL": os.environ.get("WP_URL"),
+        "WP_USERNAME": os.environ.get("WP_USERNAME"),
+        "WP_PASSWORD": os.environ.get("WP_PASSWORD"),
+    }
+
+    missing = [name for name, value in required.items() if not value]
+    if missing:
         click.echo(
-            "Error: Missing WordPress credentials in environment variables.", err=True
+            "Error: Missing WordPress credentials in environment variables: "
+            f"{', '.join(missing)}",
+            err=True,
         )
-        click.echo("Required: WP_URL, WP_USERNAME, WP_PASSWORD", err=True)
         sys.exit(1)
 
+    return required["WP_URL"], required["WP_USERNAME"], required["WP_PASSWORD"]
+
+
+def get_client() -> "WordPressClient":
+    """Get WordPress client from environment variables."""
+    # Imported here so --help and completion don't pay the
+    # client/pydantic import cost.
+    from .client import WordPressClient
+
+    url, username, password = get_credentials()
     return WordPressClient(base_url=url, username=username, password=password)
 
 
+def _csv_ints(ctx, param, value) -> Optional[List[int]]:
+    """Click callback parsing a comma-separated ID list into ints."""
+    if not value:
+        return None
+    try:
+        return [int(x) for x in value.replace(" ", "").split(",") if x]
+    except ValueError:
+        raise click.BadParameter("expected comma-separated integer IDs")
+
+
+def read_items(file_path: str) -> List:
+    """
+    Read items from a JSON (array) or JSONL (one object per line) file.
+
+    Args:
+        file_path: Path to the input file
+
+    Returns:
+        List of parsed items
+    """
+    text = Path(file_path).read_text(encoding="utf-8").strip()
+    if not text:
+        return []
+    if text.startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def echo_batch_results(responses: List[dict]) -> int:
+    """
+    Print a summary of batch sub-responses and return the failure count.
+
+    Args:
+        responses: Sub-response dicts returned by WordPressClient.batch
+
+    Returns:
+        Number of failed sub-requests
+    """
+    failed = 0
+    for i, response in enumerate(responses):
+        status = response.get("status", 0)
+        if status >= 400:
+            failed += 1
+            body = response.get("body") or {}
+            message = body.get("message", "Unknown error") if isinstance(body, dict) else body
+            click.echo(f"  ✗ Item {i + 1}: [{status}] {message}", err=True)
+
+    click.echo(f"\n{len(responses) - failed} succeeded, {failed} failed.")
+    return failed
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="wordpress-client")
 def cli():
@@ -62,31 +135,27 @@ def post():
 @click.argument("title")
 @click.argument("content")
 @click.option("--status", default="draft", help="Post status (draft, publish, private)")
-@click.option("--categories", help="Comma-separated category IDs")
-@click.option("--tags", help="Comma-separated tag IDs")
+@click.option("--categories", callback=_csv_ints, help="Comma-separated category IDs")
+@click.option("--tags", callback=_csv_ints, help="Comma-separated tag IDs")
 def create_post(
     title: str,
     content: str,
     status: str,
-    categories: Optional[str],
-    tags: Optional[str],
+    categories: Optional[List[int]],
+    tags: Optional[List[int]],
 ):
     """Create a new post."""
     try:
-        client = get_client()
+        from .models.post import PostCreate
 
-        # Parse categories and tags
-        cat_ids = (
-            [int(c.strip()) for c in categories.split(",")] if categories else None
-        )
-        tag_ids = [int(t.strip()) for t in tags.split(",")] if tags else None
+        client = get_client()
 
         post_data = PostCreate(
             title=title,
             content=content,
             status=status,
-            categories=cat_ids,
-            tags=tag_ids,
+            categories=categories,
+            tags=tags,
         )
 
         post = client.create_post(post_data)
@@ -166,6 +235,8 @@ def update_post(
 ):
     """Update an existing post."""
     try:
+        from .models.post import PostUpdate
+
         client = get_client()
 
         update_data = PostUpdate(title=title, content=content, status=status)
@@ -200,6 +271,114 @@ def delete_post(post_id: int, force: bool):
         sys.exit(1)
 
 
+@post.command("fetch-all")
+@click.option("--per-page", default=100, help="Posts per page request")
+@click.option("--concurrency", default=32, help="Maximum concurrent page requests")
+@click.option("--status", help="Filter by status")
+def fetch_all_posts(per_page: int, concurrency: int, status: Optional[str]):
+    """Fetch all posts, requesting pages concurrently."""
+    # async_client imports cleanly without aiohttp (the module sets
+    # aiohttp = None), so probe the flag rather than the import.
+    from .async_client import aiohttp, AsyncWordPressClient
+
+    if aiohttp is None:
+        click.echo(
+            "✗ Error: aiohttp is required for fetch-all "
+            "(pip install wordpress-client[async])",
+            err=True,
+        )
+        sys.exit(1)
+
+    import asyncio
+
+    url, username, password = get_credentials()
+
+    async def fetch_all():
+        async with AsyncWordPressClient(
+            base_url=url, username=username, password=password
+        ) as client:
+            return await client.get_all_posts(
+                per_page=per_page, concurrency=concurrency, status=status
+            )
+
+    try:
+        posts = asyncio.run(fetch_all())
+
+        if not posts:
+            click.echo("No posts found.")
+            return
+
+        click.echo(f"\nFound {len(posts)} post(s):\n")
+        for post in posts:
+            title = post.title.rendered if post.title else "No Title"
+            click.echo(f"  [{post.id}] {title}")
+
+    except WordPressAPIError as e:
+        click.echo(f"✗ Error: {e.message}", err=True)
+        sys.exit(1)
+
+
+@post.command("bulk-create")
+@click.argument("file_path", type=click.Path(exists=True))
+@click.option("--status", default="draft", help="Default status for posts without one")
+def bulk_create_posts(file_path: str, status: str):
+    """Create multiple posts from a JSON/JSONL file in batched requests."""
+    try:
+        client = get_client()
+        items = read_items(file_path)
+
+        if not items:
+            click.echo("No items found in file.")
+            return
+
+        requests = [
+            {"method": "POST", "path": "/wp/v2/posts", "body": {"status": status, **item}}
+            for item in items
+        ]
+
+        click.echo(f"Creating {len(items)} post(s)...")
+        responses = client.batch(requests)
+        if echo_batch_results(responses):
+            sys.exit(1)
+
+    except WordPressAPIError as e:
+        click.echo(f"✗ Error: {e.message}", err=True)
+        sys.exit(1)
+
+
+@post.command("bulk-delete")
+@click.argument("file_path", type=click.Path(exists=True))
+@click.option("--force", is_flag=True, help="Permanently delete (skip trash)")
+@click.confirmation_option(prompt="Are you sure you want to delete these posts?")
+def bulk_delete_posts(file_path: str, force: bool):
+    """Delete multiple posts listed by ID in a JSON/JSONL file."""
+    try:
+        client = get_client()
+        post_ids = read_items(file_path)
+
+        if not post_ids:
+            click.echo("No post IDs found in file.")
+            return
+
+        requests = [
+            {
+                "method": "DELETE",
+                "path": f"/wp/v2/posts/{post_id}",
+                "body": {"force": force},
+            }
+            for post_id in post_ids
+        ]
+
+        click.echo(f"Deleting {len(post_ids)} post(s)...")
+        responses = client.batch(requests)
+        if echo_batch_results(responses):
+            sys.exit(1)
+
+    except WordPressAPIError as e:
+        click.echo(f"✗ Error: {e.message}", err=True)
+        sys.exit(1)
+
+
 # ==================== CATEGORY COMMANDS ====================
 
 
@@ -219,6 +398,8 @@ def create_category(
 ):
     """Create a new category."""
     try:
+        from .models.category import CategoryCreate
+
         client = get_client()
 
         cat_data = CategoryCreate(
@@ -279,6 +460,33 @@ def delete_category(category_id: int, force: bool):
         sys.exit(1)
 
 
+@category.command("bulk-create")
+@click.argument("file_path", type=click.Path(exists=True))
+def bulk_create_categories(file_path: str):
+    """Create multiple categories from a JSON/JSONL file in batched requests."""
+    try:
+        client = get_client()
+        items = read_items(file_path)
+
+        if not items:
+            click.echo("No items found in file.")
+            return
+
+        requests = [
+            {"method": "POST", "path": "/wp/v2/categories", "body": item}
+            for item in items
+        ]
+
+        click.echo(f"Creating {len(items)} category/categories...")
+        responses = client.batch(requests)
+        if echo_batch_results(responses):
+            sys.exit(1)
+
+    except WordPressAPIError as e:
+        click.echo(f"✗ Error: {e.message}", err=True)
+        sys.exit(1)
+
+
 # ==================== MEDIA COMMANDS ====================
 
 
@@ -374,6 +582,84 @@ def delete_media(media_id: int, force: bool):
         sys.exit(1)
 
 
+@media.command("bulk-upload")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option("--concurrency", default=8, help="Number of concurrent uploads")
+@click.option("--post-id", type=int, help="Associated post ID")
+def bulk_upload_media(directory: str, concurrency: int, post_id: Optional[int]):
+    """Upload all media files from a directory concurrently."""
+    import mimetypes
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    files = [
+        p
+        for p in sorted(Path(directory).rglob("*"))
+        if p.is_file() and (mimetypes.guess_type(p.name)[0] or "").split("/")[0]
+        in ("image", "video", "audio")
+    ]
+
+    if not files:
+        click.echo("No media files found in directory.")
+        return
+
+    client = get_client()
+    click.echo(f"Uploading {len(files)} file(s) with {concurrency} worker(s)...")
+
+    failed = 0
+    # One client (and its pooled session) is shared across workers;
+    # requests.Session is thread-safe for independent requests.
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(client.upload_media, str(p), post_id=post_id): p
+            for p in files
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                media = future.result()
+                click.echo(f"  ✓ {path.name} (ID: {media.id})")
+            except WordPressAPIError as e:
+                failed += 1
+                click.echo(f"  ✗ {path.name}: {e.message}", err=True)
+
+    click.echo(f"\n{len(files) - failed} succeeded, {failed} failed.")
+    if failed:
+        sys.exit(1)
+
+
+@media.command("bulk-delete")
+@click.argument("file_path", type=click.Path(exists=True))
+@click.option("--force", is_flag=True, help="Permanently delete")
+@click.confirmation_option(prompt="Are you sure you want to delete these media items?")
+def bulk_delete_media(file_path: str, force: bool):
+    """Delete multiple media items listed by ID in a JSON/JSONL file."""
+    try:
+        client = get_client()
+        media_ids = read_items(file_path)
+
+        if not media_ids:
+            click.echo("No media IDs found in file.")
+            return
+
+        requests = [
+            {
+                "method": "DELETE",
+                "path": f"/wp/v2/media/{media_id}",
+                "body": {"force": force},
+            }
+            for media_id in media_ids
+        ]
+
+        click.echo(f"Deleting {len(media_ids)} media item(s)...")
+        responses = client.batch(requests)
+        if echo_batch_results(responses):
+            sys.exit(1)
+
+    except WordPressAPIError as e:
+        click.echo(f"✗ Error: {e.message}", err=True)
+        sys.exit(1)
+
+
 def main():
     """Main entry point for CLI."""
     cli()
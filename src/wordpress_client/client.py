@@ -4,24 +4,57 @@ WordPress REST API Client.
 Main client class for interacting with WordPress sites.
 """
 
-from typing import Optional, List, Dict, Any, Union
-import mimetypes
+from typing import Optional, List, Dict, Any, Tuple, Union
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # pragma: no cover - optional dependency
+    MultipartEncoder = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+# Transport-level errors _request converts into WordPressAPIError.
+if httpx is not None:
+    _TRANSPORT_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    _TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+
+from ._json import dumps, loads
 from .auth import AuthBase, ApplicationPasswordAuth
 from .exceptions import (
+    EXCEPTION_BY_STATUS,
     WordPressAPIError,
-    AuthenticationError,
-    NotFoundError,
     ValidationError,
-    PermissionError,
 )
-from .utils import build_api_url, parse_wp_error, validate_status
+from .utils import (
+    ACCEPT_ENCODING,
+    build_api_url,
+    chunk_list,
+    guess_mime_type,
+    parse_wp_error,
+    validate_status,
+)
+from .models import (
+    POST_LIST_ADAPTER,
+    CATEGORY_LIST_ADAPTER,
+    MEDIA_LIST_ADAPTER,
+)
 from .models.post import Post, PostCreate, PostUpdate
 from .models.media import Media, MediaUpdate
 from .models.category import Category, CategoryCreate, CategoryUpdate
 
+# Default sub-request cap of the WordPress batch endpoint
+# (filterable server-side via rest_get_max_batch_size).
+DEFAULT_MAX_BATCH_SIZE = 25
+
 
 class WordPressClient:
     """
@@ -37,6 +70,8 @@ class WordPressClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         timeout: int = 30,
+        cache_ttl: int = 0,
+        transport: str = "requests",
     ):
         """
         Initialize WordPress client.
@@ -47,9 +82,17 @@ class WordPressClient:
             username: Username (if auth not provided)
             password: Password/Application Password (if auth not provided)
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to cache GET responses (0 disables caching)
+            transport: "requests" (default) or "httpx" for an HTTP/2
+                connection (requires the http2 extra)
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Union[Dict, List]]] = {}
+        self._use_httpx = transport == "httpx"
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unknown transport: {transport}")
 
         # Set up authentication
         if auth:
@@ -60,10 +103,53 @@ class WordPressClient:
         else:
             self.auth = None
 
-        self.session = requests.Session()
+        # Advertise brotli alongside gzip/deflate when the optional
+        # brotli package is present; both transports then decompress
+        # br transparently.
+        base_headers = {
+            "User-Agent": "wordpress-client/0.1.0",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Accept": "application/json",
+        }
+
+        if self._use_httpx:
+            if httpx is None:
+                raise ImportError(
+                    "httpx is required for the httpx transport "
+                    "(pip install wordpress-client[http2])"
+                )
+            # HTTP/2 multiplexes concurrent requests over one TLS
+            # connection instead of one connection per in-flight call.
+            self.session = httpx.Client(
+                http2=True,
+                timeout=timeout,
+                headers=base_headers,
+                limits=httpx.Limits(max_connections=64),
+            )
+        else:
+            self.session = requests.Session()
+
+            # Keep-alive connection pool with retries on transient
+            # failures, so sequential calls reuse one TCP/TLS connection
+            # instead of handshaking per request.
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers.update(base_headers)
+
         if self.auth:
             self.session.headers.update(self.auth.get_auth_headers())
 
+        self._max_batch_size: Optional[int] = None
+
     def _request(
         self,
         method: str,
@@ -90,44 +176,170 @@ class WordPressClient:
         """
         url = build_api_url(self.base_url, endpoint, params)
 
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data if data and not files else None,
-                files=files,
-                timeout=self.timeout,
-            )
+        # Serve idempotent GETs from the TTL cache when enabled.
+        use_cache = method == "GET" and self.cache_ttl > 0
+        if use_cache:
+            cached = self._cache.get(url)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+
+        # Pre-serialize the body with the fast JSON encoder instead of
+        # letting requests run stdlib json.dumps via json=.
+        body_bytes = None
+        headers = None
+        if data and not files:
+            body_bytes = dumps(data)
+            headers = {"Content-Type": "application/json"}
 
-            # Handle different status codes
-            if response.status_code == 401:
-                error_msg = parse_wp_error(response.json() if response.text else {})
-                raise AuthenticationError(
-                    error_msg, response.status_code, response.json()
+        try:
+            if self._use_httpx:
+                # httpx takes raw bytes via content= and carries the
+                # timeout on the client itself.
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    content=body_bytes,
+                    files=files,
+                    headers=headers,
+                )
+            else:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    data=body_bytes,
+                    files=files,
+                    headers=headers,
+                    timeout=self.timeout,
                 )
 
-            elif response.status_code == 403:
-                error_msg = parse_wp_error(response.json() if response.text else {})
-                raise PermissionError(error_msg, response.status_code, response.json())
+            # Decode the payload exactly once; every status branch below
+            # reuses the same parsed body. Decode failures (e.g. an HTML
+            # error page) surface as WordPressAPIError like any other
+            # bad response.
+            try:
+                body = loads(response.content) if response.content else {}
+            except ValueError as e:
+                raise WordPressAPIError(f"Invalid JSON response: {str(e)}")
+
+            if response.status_code >= 400:
+                exc = EXCEPTION_BY_STATUS.get(response.status_code, WordPressAPIError)
+                raise exc(parse_wp_error(body), response.status_code, body)
+
+            if use_cache:
+                self._cache[url] = (time.monotonic(), body)
+
+            return body
+
+        except _TRANSPORT_ERRORS as e:
+            raise WordPressAPIError(f"Request failed: {str(e)}")
+
+    def _request_dict(self, *args: Any, **kwargs: Any) -> Dict:
+        """
+        Make a request whose response must be a JSON object.
+
+        Centralizes the response-shape check so individual endpoint
+        methods stay a straight call.
+
+        Raises:
+            WordPressAPIError: On API errors or a non-object response
+        """
+        response = self._request(*args, **kwargs)
+        if not isinstance(response, dict):
+            raise WordPressAPIError("Invalid response format")
+        return response
+
+    def _request_list(self, *args: Any, **kwargs: Any) -> List:
+        """
+        Make a request whose response must be a JSON array.
+
+        Raises:
+            WordPressAPIError: On API errors or a non-array response
+        """
+        response = self._request(*args, **kwargs)
+        if not isinstance(response, list):
+            raise WordPressAPIError("Invalid response format")
+        return response
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """
+        Invalidate cached GET responses.
+
+        Args:
+            endpoint: Only drop cached URLs containing this endpoint;
+                all entries are dropped when omitted
+        """
+        if endpoint is None:
+            self._cache.clear()
+            return
+
+        for url in [u for u in self._cache if endpoint in u]:
+            del self._cache[url]
+
+    # ==================== BATCH OPERATIONS ====================
 
-            elif response.status_code == 404:
-                error_msg = parse_wp_error(response.json() if response.text else {})
-                raise NotFoundError(error_msg, response.status_code, response.json())
+    def get_max_batch_size(self) -> int:
+        """
+        Get the maximum number of sub-requests the server accepts per batch.
 
-            elif response.status_code == 400:
-                error_msg = parse_wp_error(response.json() if response.text else {})
-                raise ValidationError(error_msg, response.status_code, response.json())
+        The limit is discovered via an OPTIONS request to the batch endpoint
+        and cached for the lifetime of the client. Falls back to the
+        WordPress default (25) if discovery fails.
 
-            elif response.status_code >= 400:
-                error_msg = parse_wp_error(response.json() if response.text else {})
-                raise WordPressAPIError(
-                    error_msg, response.status_code, response.json()
+        Returns:
+            Maximum batch size
+        """
+        if self._max_batch_size is None:
+            url = build_api_url(self.base_url, "batch/v1")
+            try:
+                response = self.session.options(url, timeout=self.timeout)
+                data = loads(response.content) if response.content else {}
+                self._max_batch_size = int(
+                    data["endpoints"][0]["args"]["requests"]["maxItems"]
                 )
+            except (
+                *_TRANSPORT_ERRORS,
+                KeyError,
+                IndexError,
+                TypeError,
+                ValueError,
+            ):
+                self._max_batch_size = DEFAULT_MAX_BATCH_SIZE
+        return self._max_batch_size
+
+    def batch(
+        self,
+        requests: List[Dict[str, Any]],
+        validation: str = "normal",
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute multiple API requests in a single HTTP call.
 
-            return response.json() if response.text else {}
+        Uses the WordPress batch endpoint (/wp-json/batch/v1, WordPress 5.6+)
+        to collapse N round-trips into one. Requests beyond the server's
+        batch size limit are automatically split into multiple batch calls.
 
-        except requests.exceptions.RequestException as e:
-            raise WordPressAPIError(f"Request failed: {str(e)}")
+        Args:
+            requests: List of sub-request dicts, each with "method", "path"
+                (e.g. "/wp/v2/posts"), and optionally "body" and "headers"
+            validation: "normal" (run all sub-requests) or
+                "require-all-validate" (abort all if any fails validation)
+
+        Returns:
+            List of sub-response dicts (with "status", "headers", "body"),
+            in the same order as the input requests
+
+        Raises:
+            WordPressAPIError: On API errors
+        """
+        responses: List[Dict[str, Any]] = []
+        max_size = self.get_max_batch_size()
+
+        for chunk in chunk_list(requests, max_size):
+            payload = {"validation": validation, "requests": chunk}
+            data = self._request_dict("POST", "batch/v1", data=payload)
+            responses.extend(data.get("responses", []))
+
+        return responses
 
     # ==================== POST OPERATIONS ====================
 
@@ -164,12 +376,12 @@ class WordPressClient:
         if status:
             params["status"] = status
         if categories:
-            params["categories"] = ",".join(map(str, categories))
+            params["categories"] = categories
         if tags:
-            params["tags"] = ",".join(map(str, tags))
+            params["tags"] = tags
 
-        data = self._request("GET", "wp/v2/posts", params=params)
-        return [Post(**post) for post in data]
+        data = self._request_list("GET", "wp/v2/posts", params=params)
+        return POST_LIST_ADAPTER.validate_python(data)
 
     def get_post(self, post_id: int) -> Post:
         """
@@ -181,9 +393,7 @@ class WordPressClient:
         Returns:
             Post object
         """
-        data = self._request("GET", f"wp/v2/posts/{post_id}")
-        if not isinstance(data, dict):
-            raise WordPressAPIError("Invalid response format")
+        data = self._request_dict("GET", f"wp/v2/posts/{post_id}")
         return Post(**data)
 
     def create_post(self, post: PostCreate) -> Post:
@@ -199,10 +409,8 @@ class WordPressClient:
         if post.status and not validate_status(post.status):
             raise ValidationError(f"Invalid status: {post.status}")
 
-        data = post.model_dump(exclude_none=True)
-        response_data = self._request("POST", "wp/v2/posts", data=data)
-        if not isinstance(response_data, dict):
-            raise WordPressAPIError("Invalid response format")
+        data = post.model_dump(include=post.model_fields_set, exclude_none=True)
+        response_data = self._request_dict("POST", "wp/v2/posts", data=data)
         return Post(**response_data)
 
     def update_post(self, post_id: int, post: PostUpdate) -> Post:
@@ -219,10 +427,9 @@ class WordPressClient:
         if post.status and not validate_status(post.status):
             raise ValidationError(f"Invalid status: {post.status}")
 
-        data = post.model_dump(exclude_none=True)
-        response_data = self._request("POST", f"wp/v2/posts/{post_id}", data=data)
-        if not isinstance(response_data, dict):
-            raise WordPressAPIError("Invalid response format")
+        data = post.model_dump(include=post.model_fields_set, exclude_none=True)
+        self.invalidate(f"wp/v2/posts/{post_id}")
+        response_data = self._request_dict("POST", f"wp/v2/posts/{post_id}", data=data)
         return Post(**response_data)
 
     def delete_post(self, post_id: int, force: bool = False) -> Dict:
@@ -237,9 +444,8 @@ class WordPressClient:
             Response data
         """
         params = {"force": force}
-        response = self._request("DELETE", f"wp/v2/posts/{post_id}", params=params)
-        if not isinstance(response, dict):
-            raise WordPressAPIError("Invalid response format")
+        self.invalidate(f"wp/v2/posts/{post_id}")
+        response = self._request_dict("DELETE", f"wp/v2/posts/{post_id}", params=params)
         return response
 
     # ==================== CATEGORY OPERATIONS ====================
@@ -273,8 +479,8 @@ class WordPressClient:
         if parent is not None:
             params["parent"] = parent
 
-        data = self._request("GET", "wp/v2/categories", params=params)
-        return [Category(**cat) for cat in data]
+        data = self._request_list("GET", "wp/v2/categories", params=params)
+        return CATEGORY_LIST_ADAPTER.validate_python(data)
 
     def get_category(self, category_id: int) -> Category:
         """
@@ -286,9 +492,7 @@ class WordPressClient:
         Returns:
             Category object
         """
-        data = self._request("GET", f"wp/v2/categories/{category_id}")
-        if not isinstance(data, dict):
-            raise WordPressAPIError("Invalid response format")
+        data = self._request_dict("GET", f"wp/v2/categories/{category_id}")
         return Category(**data)
 
     def create_category(self, category: CategoryCreate) -> Category:
@@ -301,10 +505,10 @@ class WordPressClient:
         Returns:
             Created Category object
         """
-        data = category.model_dump(exclude_none=True)
-        response_data = self._request("POST", "wp/v2/categories", data=data)
-        if not isinstance(response_data, dict):
-            raise WordPressAPIError("Invalid response format")
+        data = category.model_dump(
+            include=category.model_fields_set, exclude_none=True
+        )
+        response_data = self._request_dict("POST", "wp/v2/categories", data=data)
         return Category(**response_data)
 
     def update_category(self, category_id: int, category: CategoryUpdate) -> Category:
@@ -318,12 +522,13 @@ class WordPressClient:
         Returns:
             Updated Category object
         """
-        data = category.model_dump(exclude_none=True)
-        response_data = self._request(
+        data = category.model_dump(
+            include=category.model_fields_set, exclude_none=True
+        )
+        self.invalidate(f"wp/v2/categories/{category_id}")
+        response_data = self._request_dict(
             "POST", f"wp/v2/categories/{category_id}", data=data
         )
-        if not isinstance(response_data, dict):
-            raise WordPressAPIError("Invalid response format")
         return Category(**response_data)
 
     def delete_category(self, category_id: int, force: bool = False) -> Dict:
@@ -338,9 +543,8 @@ class WordPressClient:
             Response data
         """
         params = {"force": force}
-        response = self._request("DELETE", f"wp/v2/categories/{category_id}", params=params)
-        if not isinstance(response, dict):
-            raise WordPressAPIError("Invalid response format")
+        self.invalidate(f"wp/v2/categories/{category_id}")
+        response = self._request_dict("DELETE", f"wp/v2/categories/{category_id}", params=params)
         return response
 
     # ==================== MEDIA OPERATIONS ====================
@@ -374,8 +578,8 @@ class WordPressClient:
         if media_type:
             params["media_type"] = media_type
 
-        data = self._request("GET", "wp/v2/media", params=params)
-        return [Media(**item) for item in data]
+        data = self._request_list("GET", "wp/v2/media", params=params)
+        return MEDIA_LIST_ADAPTER.validate_python(data)
 
     def get_media_item(self, media_id: int) -> Media:
         """
@@ -387,9 +591,7 @@ class WordPressClient:
         Returns:
             Media object
         """
-        data = self._request("GET", f"wp/v2/media/{media_id}")
-        if not isinstance(data, dict):
-            raise WordPressAPIError("Invalid response format")
+        data = self._request_dict("GET", f"wp/v2/media/{media_id}")
         return Media(**data)
 
     def upload_media(
@@ -414,20 +616,17 @@ class WordPressClient:
             Created Media object
         """
         path = Path(file_path)
-        if not path.exists():
-            raise ValidationError(f"File not found: {file_path}")
+        mime_type = guess_mime_type(path.name)
 
-        # Detect mime type
-        mime_type, _ = mimetypes.guess_type(str(path))
-        if not mime_type:
-            mime_type = "application/octet-stream"
-
-        # Prepare file upload
-        with open(path, "rb") as f:
-            files = {"file": (path.name, f, mime_type)}
+        # Open directly instead of exists() + open, avoiding a second
+        # stat call per upload.
+        try:
+            file_obj = path.open("rb")
+        except OSError:
+            raise ValidationError(f"File not found: {file_path}")
 
-            # Add headers for metadata
-            headers = self.auth.get_auth_headers() if self.auth else {}
+        with file_obj as f:
+            headers = {}
             if title:
                 headers["Content-Disposition"] = f'attachment; filename="{path.name}"'
 
@@ -445,12 +644,32 @@ class WordPressClient:
             url = build_api_url(self.base_url, "wp/v2/media", params)
 
             try:
-                response = requests.post(
-                    url, files=files, headers=headers, timeout=self.timeout
-                )
+                if MultipartEncoder is not None and not self._use_httpx:
+                    # Stream the body straight from disk so peak memory
+                    # stays constant regardless of file size.
+                    encoder = MultipartEncoder(
+                        fields={"file": (path.name, f, mime_type)}
+                    )
+                    headers["Content-Type"] = encoder.content_type
+                    response = self.session.post(
+                        url, data=encoder, headers=headers, timeout=self.timeout
+                    )
+                else:
+                    # httpx streams file objects natively, so the
+                    # files= path stays constant-memory there too.
+                    response = self.session.post(
+                        url,
+                        files={"file": (path.name, f, mime_type)},
+                        headers=headers,
+                        timeout=self.timeout,
+                    )
                 response.raise_for_status()
-                return Media(**response.json())
-            except requests.exceptions.RequestException as e:
+                try:
+                    body = loads(response.content)
+                except ValueError as e:
+                    raise WordPressAPIError(f"Invalid JSON response: {str(e)}")
+                return Media(**body)
+            except _TRANSPORT_ERRORS as e:
                 raise WordPressAPIError(f"Media upload failed: {str(e)}")
 
     def update_media(self, media_id: int, media: MediaUpdate) -> Media:
@@ -464,10 +683,9 @@ class WordPressClient:
         Returns:
             Updated Media object
         """
-        data = media.model_dump(exclude_none=True)
-        response_data = self._request("POST", f"wp/v2/media/{media_id}", data=data)
-        if not isinstance(response_data, dict):
-            raise WordPressAPIError("Invalid response format")
+        data = media.model_dump(include=media.model_fields_set, exclude_none=True)
+        self.invalidate(f"wp/v2/media/{media_id}")
+        response_data = self._request_dict("POST", f"wp/v2/media/{media_id}", data=data)
         return Media(**response_data)
 
     def delete_media(self, media_id: int, force: bool = False) -> Dict:
@@ -482,9 +700,8 @@ class WordPressClient:
             Response data
         """
         params = {"force": force}
-        response = self._request("DELETE", f"wp/v2/media/{media_id}", params=params)
-        if not isinstance(response, dict):
-            raise WordPressAPIError("Invalid response format")
+        self.invalidate(f"wp/v2/media/{media_id}")
+        response = self._request_dict("DELETE", f"wp/v2/media/{media_id}", params=params)
         return response
 
 
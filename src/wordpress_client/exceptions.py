@@ -66,3 +66,13 @@ class PermissionError(WordPressAPIError):
         response: Optional[dict] = None,
     ):
         super().__init__(message, status_code, response)
+
+
+# Exception class raised for each well-known error status; anything
+# else >= 400 falls back to WordPressAPIError.
+EXCEPTION_BY_STATUS = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: PermissionError,
+    404: NotFoundError,
+}
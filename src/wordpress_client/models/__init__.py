@@ -2,10 +2,21 @@
 WordPress data models.
 """
 
+from typing import List
+
+from pydantic import TypeAdapter
+
 from .post import Post, PostCreate, PostUpdate
 from .media import Media, MediaUpload, MediaUpdate
 from .category import Category, CategoryCreate, CategoryUpdate
 
+# Shared list validators for the collection endpoints. A single
+# validate_python call runs the whole loop inside pydantic-core rather
+# than re-entering each model constructor from Python.
+POST_LIST_ADAPTER = TypeAdapter(List[Post])
+CATEGORY_LIST_ADAPTER = TypeAdapter(List[Category])
+MEDIA_LIST_ADAPTER = TypeAdapter(List[Media])
+
 __all__ = [
     "Post",
     "PostCreate",
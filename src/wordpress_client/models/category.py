@@ -3,7 +3,7 @@ Category model for WordPress API.
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Category(BaseModel):
@@ -13,6 +13,8 @@ class Category(BaseModel):
     Represents a WordPress category/taxonomy term.
     """
 
+    model_config = ConfigDict(extra="ignore")
+
     id: Optional[int] = None
     count: Optional[int] = Field(default=0, description="Number of posts in category")
     description: Optional[str] = Field(default="", description="Category description")
@@ -4,7 +4,7 @@ Media model for WordPress API.
 
 from typing import Optional, Dict
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MediaDetails(BaseModel):
@@ -57,10 +57,12 @@ class Media(BaseModel):
     post: Optional[int] = Field(default=None, description="Associated post ID")
     source_url: Optional[str] = None
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    # Ignore fields the API adds that we don't model, instead of
+    # carrying them around as extras.
+    model_config = ConfigDict(
+        extra="ignore",
+        json_encoders={datetime: lambda v: v.isoformat() if v else None},
+    )
 
 
 class MediaUpload(BaseModel):
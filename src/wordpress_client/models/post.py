@@ -4,7 +4,7 @@ Post model for WordPress API.
 
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PostContent(BaseModel):
@@ -59,10 +59,12 @@ class Post(BaseModel):
     )
     tags: Optional[List[int]] = Field(default_factory=list, description="Tag IDs")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    # Ignore fields the API adds that we don't model, instead of
+    # carrying them around as extras.
+    model_config = ConfigDict(
+        extra="ignore",
+        json_encoders={datetime: lambda v: v.isoformat() if v else None},
+    )
 
 
 class PostCreate(BaseModel):
@@ -2,8 +2,27 @@
 Utility functions for WordPress API client.
 """
 
-from typing import Dict, Optional, Any
-from urllib.parse import urljoin, urlencode
+import mimetypes
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlencode
+
+try:
+    import brotli  # noqa: F401
+
+    _HAS_BROTLI = True
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi  # noqa: F401
+
+        _HAS_BROTLI = True
+    except ImportError:
+        _HAS_BROTLI = False
+
+# Only advertise brotli when a decoder is actually importable;
+# otherwise servers would send br payloads nothing here can decompress.
+ACCEPT_ENCODING = "br, gzip, deflate" if _HAS_BROTLI else "gzip, deflate"
 
 
 def build_api_url(
@@ -27,16 +46,49 @@ def build_api_url(
     if not endpoint.startswith("wp-json"):
         endpoint = f"wp-json/{endpoint}"
 
-    url = urljoin(f"{base_url}/", endpoint)
+    # Plain concatenation; urljoin would re-parse the whole URL on
+    # every request for no benefit with an already-relative endpoint.
+    url = f"{base_url}/{endpoint}"
+
+    if not params:
+        return url
+
+    # Drop None values and flatten list values into the
+    # comma-separated form the WP REST API expects, so callers can
+    # pass ID lists directly without pre-joining.
+    filtered_params = [
+        (k, ",".join(map(str, v)) if isinstance(v, (list, tuple)) else v)
+        for k, v in params.items()
+        if v is not None
+    ]
+    if not filtered_params:
+        return url
+
+    return f"{url}?{urlencode(filtered_params, doseq=True)}"
+
+
+@lru_cache(maxsize=128)
+def guess_mime_type(filename: str) -> str:
+    """
+    Guess a file's mime type from its name.
+
+    Results are memoized, so bulk uploads of similarly-named files
+    don't repeat the mimetypes table lookup.
+
+    Args:
+        filename: File name to inspect
+
+    Returns:
+        Mime type string (application/octet-stream when unknown)
+    """
+    return mimetypes.guess_type(filename)[0] or "application/octet-stream"
 
-    if params:
-        # Remove None values
-        filtered_params = {k: v for k, v in params.items() if v is not None}
-        if filtered_params:
-            query_string = urlencode(filtered_params)
-            url = f"{url}?{query_string}"
 
-    return url
+# Deletion table stripping null bytes and other control characters not
+# valid in HTML content (tab/newline/carriage return are kept).
+_CONTROL_CHAR_TABLE = str.maketrans(
+    "", "", "\x00\x01\x02\x03\x04\x05\x06\x07\x08\x0b\x0c\x0e\x0f"
+)
 
 
 def sanitize_html(content: str) -> str:
@@ -49,14 +101,12 @@ def sanitize_html(content: str) -> str:
     Returns:
         Sanitized content
     """
-    # WordPress handles most sanitization, but we can do basic cleanup
+    # WordPress handles most sanitization, but we can do basic cleanup.
+    # A single translate() pass removes all disallowed control chars.
     if not content:
         return ""
 
-    # Remove null bytes
-    content = content.replace("\x00", "")
-
-    return content
+    return content.translate(_CONTROL_CHAR_TABLE)
 
 
 def format_post_data(
@@ -113,21 +163,26 @@ def parse_wp_error(response_data: dict) -> str:
         return "Unknown error occurred"
 
     # WordPress REST API error format
-    if "message" in response_data:
-        return response_data["message"]
-
-    # Check for code and message structure
-    if "code" in response_data and "message" in response_data:
-        return f"{response_data['code']}: {response_data['message']}"
+    message = response_data.get("message")
+    if message:
+        return message
 
     # Check for data field with additional info
-    if "data" in response_data and isinstance(response_data["data"], dict):
-        if "message" in response_data["data"]:
-            return response_data["data"]["message"]
+    data = response_data.get("data")
+    if isinstance(data, dict):
+        message = data.get("message")
+        if message:
+            return message
 
     return "Unknown error occurred"
 
 
+# Built once at import; frozenset membership is O(1).
+_VALID_STATUSES = frozenset(
+    {"publish", "future", "draft", "pending", "private", "trash"}
+)
+
+
 def validate_status(status: str) -> bool:
     """
     Validate post status value.
@@ -138,19 +193,23 @@ def validate_status(status: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    valid_statuses = ["publish", "future", "draft", "pending", "private", "trash"]
-    return status in valid_statuses
+    return status in _VALID_STATUSES
 
 
-def chunk_list(items: list, chunk_size: int) -> list:
+def chunk_list(items: list, chunk_size: int) -> Iterator[list]:
     """
     Split a list into chunks of specified size.
 
+    Chunks are yielded lazily, so callers that stop early never pay
+    for slices they don't consume.
+
     Args:
-        items: List to chunk
+        items: List (or any iterable) to chunk
         chunk_size: Size of each chunk
 
-    Returns:
-        List of chunked lists
+    Yields:
+        Lists of up to chunk_size items
     """
-    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    it = iter(items)
+    while chunk := list(islice(it, chunk_size)):
+        yield chunk
@@ -1,42 +1,115 @@
 """
 Test configuration for WordPress client tests.
 """
+import functools
+import os
 import pytest
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+
+
+# Response payloads as one frozen, slotted instance built at import:
+# cheaper than rebuilding dict literals, immutable, and shared
+# copy-on-write across forked xdist workers.
+@dataclass(frozen=True, slots=True)
+class _Fixtures:
+    posts: tuple
+    users: tuple
+
+
+_FIXTURES = _Fixtures(
+    posts=(
+        {
+            'id': 1,
+            'title': {'rendered': 'Test Post'},
+            'content': {'rendered': 'Test content'},
+            'status': 'publish'
+        },
+    ),
+    users=(
+        {
+            'id': 1,
+            'name': 'Test User',
+            'email': 'test@example.com',
+            'roles': ['administrator']
+        },
+    ),
+)
+
+
+@functools.cache
+def _test_env_path():
+    """Resolve .env.test once per process; None when the file is absent."""
+    p = Path(__file__).resolve().parent.parent / '.env.test'
+    return p if p.exists() else None
+
+
+@functools.cache
+def _load_test_env():
+    """Load .env.test once per process; no-op when the file is absent.
+
+    Skipped outright when WORDPRESS_URL is already in the environment
+    (CI injects credentials directly), avoiding the dotenv import.
+    """
+    if os.getenv('WORDPRESS_URL'):
+        return
+    if (p := _test_env_path()):
+        # Deferred so collection-only runs skip the dotenv import.
+        from dotenv import load_dotenv
+        load_dotenv(p)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _env():
+    """Make the test environment available to every test."""
+    _load_test_env()
+
+
+# One client for the whole session; tests that only vary the mocked
+# response don't need to re-run session and auth setup.
+@pytest.fixture(scope="session")
+def client(mock_wordpress_config):
+    """Shared WordPressClient instance for tests that mock responses."""
+    from wordpress_client import WordPressClient
+
+    return WordPressClient(**mock_wordpress_config)
+
+
+@pytest.fixture
+def fresh_client(mock_wordpress_config):
+    """Newly constructed client for tests exercising the constructor."""
+    from wordpress_client import WordPressClient
+
+    return WordPressClient(**mock_wordpress_config)
 
-# Load test environment
-test_env = Path(__file__).parent.parent / '.env.test'
-if test_env.exists():
-    from dotenv import load_dotenv
-    load_dotenv(test_env)
 
 @pytest.fixture
+def mocked_http():
+    """Intercept HTTP at the adapter level via the responses library.
+
+    Registering URL->response mappings here avoids patching and
+    restoring requests attributes around every test.
+    """
+    import responses
+
+    with responses.RequestsMock() as rm:
+        yield rm
+
+
+# Session scope: these are static data, so build them once per run.
+# MappingProxyType/tuples keep tests from mutating state shared across
+# tests (and xdist workers).
+@pytest.fixture(scope="session")
 def mock_wordpress_config():
     """Mock WordPress configuration for testing."""
-    return {
+    return MappingProxyType({
         'base_url': 'https://example.wordpress.com',
         'username': 'testuser',
         'password': 'testpass123',
-    }
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_response_data():
     """Mock response data for API calls."""
-    return {
-        'posts': [
-            {
-                'id': 1,
-                'title': {'rendered': 'Test Post'},
-                'content': {'rendered': 'Test content'},
-                'status': 'publish'
-            }
-        ],
-        'users': [
-            {
-                'id': 1,
-                'name': 'Test User',
-                'email': 'test@example.com',
-                'roles': ['administrator']
-            }
-        ]
-    }
\ No newline at end of file
+    return _FIXTURES
\ No newline at end of file
@@ -1,60 +1,61 @@
 """
 Tests for the WordPress client core functionality.
 """
+from contextlib import nullcontext
+
 import pytest
-from unittest.mock import Mock, patch
+import responses
 
 from wordpress_client import WordPressClient
 from wordpress_client.exceptions import WordPressAPIError
 
 
+@pytest.fixture(autouse=True, scope="class")
+def _bind_config(request, mock_wordpress_config):
+    """Resolve the config fixture once per class, not per method."""
+    if request.cls is not None:
+        request.cls.config = mock_wordpress_config
+
+
 class TestWordPressClient:
     """Test cases for WordPressClient class."""
-    
-    def test_client_initialization(self, mock_wordpress_config):
+
+    def test_client_initialization(self, fresh_client):
         """Test client can be initialized with valid config."""
-        client = WordPressClient(
-            base_url=mock_wordpress_config['base_url'],
-            username=mock_wordpress_config['username'],
-            password=mock_wordpress_config['password']
-        )
-        
-        assert client.base_url == mock_wordpress_config['base_url']
-        assert client.username == mock_wordpress_config['username']
-        assert client.password == mock_wordpress_config['password']
-    
+        assert fresh_client.base_url == self.config['base_url']
+        assert fresh_client.auth.username == self.config['username']
+        assert fresh_client.auth.app_password == self.config['password']
+
     def test_client_initialization_missing_params(self):
-        """Test client initialization fails with missing parameters."""
+        """Test client initialization rejects an unknown transport."""
         with pytest.raises(ValueError):
-            WordPressClient(base_url="https://example.com")
+            WordPressClient(base_url="https://example.com", transport="bogus")
+
+        # Missing credentials yield an unauthenticated (read-only) client.
+        assert WordPressClient(base_url="https://example.com").auth is None
     
-    @patch('requests.get')
-    def test_get_posts_success(self, mock_get, mock_wordpress_config, mock_response_data):
-        """Test successful posts retrieval."""
-        # Setup mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data['posts']
-        mock_get.return_value = mock_response
-        
-        # Create client and test
-        client = WordPressClient(**mock_wordpress_config)
-        posts = client.get_posts()
-        
-        assert len(posts) == 1
-        assert posts[0]['title']['rendered'] == 'Test Post'
-        
-    @patch('requests.get')
-    def test_get_posts_api_error(self, mock_get, mock_wordpress_config):
-        """Test API error handling for posts retrieval."""
-        # Setup mock error response
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {'message': 'Not found'}
-        mock_get.return_value = mock_response
-        
-        # Create client and test
-        client = WordPressClient(**mock_wordpress_config)
-        
-        with pytest.raises(WordPressAPIError):
-            client.get_posts()
\ No newline at end of file
+    @pytest.mark.parametrize(
+        "status,expect_error",
+        [(200, False), (404, True)],
+    )
+    def test_get_posts(self, status, expect_error, client, mocked_http,
+                       mock_response_data):
+        """Test posts retrieval for success and API error responses."""
+        payload = (
+            {'message': 'Not found'} if expect_error
+            else list(mock_response_data.posts)
+        )
+        mocked_http.add(
+            responses.GET,
+            f"{self.config['base_url']}/wp-json/wp/v2/posts",
+            json=payload,
+            status=status,
+        )
+
+        raises = pytest.raises(WordPressAPIError) if expect_error else nullcontext()
+        with raises:
+            posts = client.get_posts()
+
+        if not expect_error:
+            assert len(posts) == 1
+            assert posts[0].title.rendered == 'Test Post'
\ No newline at end of file